@@ -1,16 +1,22 @@
+import bisect
 import datetime as dt
 import functools
+import itertools
+import re
 from collections import OrderedDict
 from enum import Enum, unique
 from typing import Union, Annotated, Callable
 
+import numpy as np
 import pandas as pd
 from pydantic import (
     BaseModel,
     Field,
+    PrivateAttr,
     RootModel,
+    ValidationError,
     model_validator,
-    validate_call,
+    TypeAdapter,
     WithJsonSchema,
     BeforeValidator,
     AfterValidator,
@@ -40,6 +46,8 @@ class DayType(str, Enum):
     QUARTERLY_EXPIRY: A quarterly expiry.
     """
 
+    __slots__ = ()
+
     HOLIDAY = "holiday"
     SPECIAL_OPEN = "special_open"
     SPECIAL_CLOSE = "special_close"
@@ -47,6 +55,48 @@ class DayType(str, Enum):
     QUARTERLY_EXPIRY = "quarterly_expiry"
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_timestamp(value: Any) -> pd.Timestamp:
+    """
+    Convert a hashable value to a Pandas timestamp, memoizing the result.
+
+    Repeated conversions of the same input, e.g. the same date string used as a key in several places, are served
+    from the cache instead of going through pd.Timestamp again.
+
+    Parameters
+    ----------
+    value : Any
+        The value to convert. Must be hashable.
+
+    Returns
+    -------
+    pd.Timestamp
+        The converted value.
+
+    Raises
+    ------
+    ValueError
+        If the value cannot be converted to pd.Timestamp or converts to pd.NaT.
+    """
+    try:
+        # Convert value to timestamp.
+        # noinspection PyTypeChecker
+        ts = pd.Timestamp(value)
+    except ValueError as e:
+        # Failed to convert key to timestamp.
+        raise ValueError(
+            f'Failed to convert "{value}" of type {type(value)} to {pd.Timestamp}.'
+        ) from e
+    else:
+        if ts is pd.NaT:
+            # Failed to convert key to timestamp.
+            raise ValueError(
+                f'Failed to convert "{value}" of type {type(value)} to {pd.Timestamp}.'
+            )
+
+    return ts
+
+
 def _to_timestamp(value: Any) -> pd.Timestamp:
     """
     Convert value to Pandas timestamp.
@@ -67,22 +117,31 @@ def _to_timestamp(value: Any) -> pd.Timestamp:
         If the value cannot be converted to pd.Timestamp or converts to pd.NaT.
     """
     # Check if value is a valid timestamp.
-    if not isinstance(value, pd.Timestamp):
-        try:
-            # Convert value to timestamp.
-            # noinspection PyTypeChecker
-            value = pd.Timestamp(value)
-        except ValueError as e:
+    if isinstance(value, pd.Timestamp):
+        return value
+
+    try:
+        # Hashable values, e.g. strings, go through the cached conversion.
+        return _cached_timestamp(value)
+    except TypeError:
+        # Unhashable value, convert without caching.
+        pass
+
+    try:
+        # Convert value to timestamp.
+        # noinspection PyTypeChecker
+        value = pd.Timestamp(value)
+    except ValueError as e:
+        # Failed to convert key to timestamp.
+        raise ValueError(
+            f'Failed to convert "{value}" of type {type(value)} to {pd.Timestamp}.'
+        ) from e
+    else:
+        if value is pd.NaT:
             # Failed to convert key to timestamp.
             raise ValueError(
                 f'Failed to convert "{value}" of type {type(value)} to {pd.Timestamp}.'
-            ) from e
-        else:
-            if value is pd.NaT:
-                # Failed to convert key to timestamp.
-                raise ValueError(
-                    f'Failed to convert "{value}" of type {type(value)} to {pd.Timestamp}.'
-                )
+            )
 
     return value
 
@@ -107,6 +166,11 @@ def _to_date(value: pd.Timestamp) -> pd.Timestamp:
     return value.tz_localize(None).normalize()
 
 
+def _is_strictly_sorted(values: list) -> bool:
+    """Check in a single linear pass that the given values are sorted in strictly increasing order."""
+    return all(a < b for a, b in zip(values, values[1:]))
+
+
 # A type alias for pd.Timestamp that allows initialisation from suitably formatted string values.
 TimestampLike = Annotated[
     pd.Timestamp,
@@ -127,12 +191,19 @@ DateLike = Annotated[
     Field(examples=["2020-01-01"]),
 ]
 
+# Type adapter for DateLike, created once at module load. Re-used by methods that validate their arguments by hand
+# to avoid rebuilding the validation machinery on every call.
+_DATE_ADAPTER = TypeAdapter(DateLike, config={"arbitrary_types_allowed": True})
+
 
 class AbstractDayProps(
-    BaseModel, arbitrary_types_allowed=True, validate_assignment=True, extra="forbid"
+    BaseModel, arbitrary_types_allowed=True, frozen=True, extra="forbid"
 ):
     """
     Abstract base class for special day properties.
+
+    Day properties are immutable once created; this also makes them hashable. Unknown keys are rejected since the
+    shape of a day specification is part of the API contract.
     """
 
     name: str = Field(
@@ -155,6 +226,51 @@ class DayProps(AbstractDayProps):
         return f'{{type={self.type.name}, name="{self.name}"}}'
 
 
+# Time strings eligible for the dt.time.fromisoformat fast path in _parse_time_str. Restricted to HH:MM(:SS) so
+# that the accepted grammar stays exactly that of the strptime formats; on Python 3.11+, fromisoformat would
+# otherwise also accept e.g. fractional seconds, UTC offsets, or colon-less forms.
+_TIME_STR_RE = re.compile(r"\d{2}:\d{2}(:\d{2})?\Z")
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_time_str(value: str) -> dt.time:
+    """
+    Parse a time string, memoizing the result.
+
+    Tries the C-implemented dt.time.fromisoformat first and only falls back to the slower strptime formats on
+    failure. The same handful of open/close times tends to recur across a calendar, so repeated values are served
+    from the cache.
+
+    Parameters
+    ----------
+    value : str
+        The value to parse.
+
+    Returns
+    -------
+    dt.time
+        The parsed value.
+
+    Raises
+    ------
+    ValueError
+        If the value cannot be parsed to dt.time.
+    """
+    if _TIME_STR_RE.fullmatch(value):
+        try:
+            return dt.time.fromisoformat(value)
+        except ValueError:
+            pass
+
+    for f in ("%H:%M", "%H:%M:%S"):
+        try:
+            return dt.datetime.strptime(value, f).time()
+        except ValueError:
+            pass
+
+    raise ValueError(f"Failed to convert {value} to {dt.time}.")
+
+
 def _to_time(value: Union[dt.time, str]):
     """
     Convert value to time.
@@ -175,16 +291,10 @@ def _to_time(value: Union[dt.time, str]):
         If the value cannot be converted to dt.time.
     """
     if not isinstance(value, dt.time):
-        for f in ("%H:%M", "%H:%M:%S"):
-            try:
-                # noinspection PyTypeChecker
-                value = dt.datetime.strptime(value, f).time()
-                break
-            except ValueError:
-                pass
+        if isinstance(value, str):
+            return _parse_time_str(value)
 
-        if not isinstance(value, dt.time):
-            raise ValueError(f"Failed to convert {value} to {dt.time}.")
+        raise ValueError(f"Failed to convert {value} to {dt.time}.")
 
     return value
 
@@ -215,15 +325,23 @@ class DayPropsWithTime(AbstractDayProps):
 # Type alias for valid day properties.
 DayPropsLike = Annotated[Union[DayProps, DayPropsWithTime], Field(discriminator="type")]
 
+# Type adapter for DayPropsLike, created once at module load. Building the discriminated-union validator is
+# expensive, so it is shared across all calls rather than rebuilt per call.
+_DAY_PROPS_ADAPTER = TypeAdapter(DayPropsLike)
+
 Tags = Annotated[
     Union[list[str], Union[tuple[str], Union[set[str], None]]],
     Field(examples=[["tag1", "tag2"]]),
 ]
 
+# Type adapter for Tags, created once at module load and shared across calls.
+_TAGS_ADAPTER = TypeAdapter(Tags)
 
-class DayMeta(
-    BaseModel, arbitrary_types_allowed=True, validate_assignment=True, extra="forbid"
-):
+# Type adapter for an optional comment, created once at module load and shared across calls.
+_COMMENT_ADAPTER = TypeAdapter(Union[str, None])
+
+
+class DayMeta(BaseModel, arbitrary_types_allowed=True, extra="forbid"):
     """
     Metadata for a single date.
     """
@@ -236,12 +354,17 @@ class DayMeta(
 
     @model_validator(mode="after")
     def _canonicalize(self) -> "DayMeta":
-        # Sort tags alphabetically and remove duplicates.
-        self.__dict__["tags"] = sorted(set(self.tags or []))
+        # Sort tags alphabetically and remove duplicates, unless they already form a strictly sorted list, i.e.
+        # are canonical, which is the common case on re-validation.
+        tags = self.tags
+        if not (isinstance(tags, list) and _is_strictly_sorted(tags)):
+            self.__dict__["tags"] = sorted(set(tags or []))
 
         # Strip comment of whitespace and set to None if empty.
         if self.comment is not None:
-            self.__dict__["comment"] = self.comment.strip() or None
+            comment = self.comment.strip() or None
+            if comment != self.comment:
+                self.__dict__["comment"] = comment
 
         return self
 
@@ -249,6 +372,9 @@ class DayMeta(
         return len(self.tags) + (1 if self.comment is not None else 0)
 
 
+# Type adapter for optional day metadata, created once at module load and shared across calls.
+_DAY_META_ADAPTER = TypeAdapter(Union[DayMeta, None])
+
 T_Self = TypeVar("S")
 P = ParamSpec("P")
 
@@ -257,10 +383,12 @@ def _with_meta(
     f: Callable[Concatenate[T_Self, DayMeta, P], DayMeta],
 ) -> Callable[Concatenate[T_Self, DateLike, P], T_Self]:
     @functools.wraps(f)
-    @validate_call(config={"arbitrary_types_allowed": True})
     def wrapper(
         self: T_Self, date: DateLike, *args: P.args, **kwargs: P.kwargs
     ) -> T_Self:
+        # Validate date through the shared adapter instead of validate_call.
+        date = _DATE_ADAPTER.validate_python(date)
+
         # Retrieve meta for given day.
         meta = self.meta.get(date, DayMeta())
 
@@ -273,12 +401,19 @@ def _with_meta(
         else:
             self.meta[date] = meta
 
+        self._invalidate_all_days_cache()
+
         # Return self.
         return self
 
     return wrapper
 
 
+# Minimum number of dates from which all_days switches to the vectorized numpy path. Below this, the constant
+# overhead of building the array outweighs the faster sort.
+_ALL_DAYS_VECTORIZE_MIN_SIZE = 32
+
+
 class ChangeSet(
     BaseModel, arbitrary_types_allowed=True, validate_assignment=True, extra="forbid"
 ):
@@ -338,26 +473,144 @@ class ChangeSet(
         ],
     )
 
+    # Set of dates to remove, parallel to the sorted remove list, for O(1) membership checks. Holds the
+    # pd.Timestamp objects themselves; hashing them is unit-safe, whereas their int64 nanosecond values overflow
+    # for dates that pandas represents in a coarser unit. Built lazily and invalidated whenever the remove list is
+    # replaced wholesale.
+    _remove_set: Union[set, None] = PrivateAttr(default=None)
+
+    # Cached results of all_days, without and with meta dates, respectively. None means not computed or invalidated
+    # by a mutation since the last computation.
+    _all_days_cache: Union[tuple, None] = PrivateAttr(default=None)
+    _all_days_meta_cache: Union[tuple, None] = PrivateAttr(default=None)
+
+    def _invalidate_all_days_cache(self) -> None:
+        """Drop the cached all_days results. Called by every mutation of the changeset."""
+        self._all_days_cache = None
+        self._all_days_meta_cache = None
+
+    def _get_remove_set(self) -> set:
+        """Return the set of dates to remove, building it from the remove list if necessary."""
+        if self._remove_set is None:
+            self._remove_set = set(self.remove)
+
+        return self._remove_set
+
+    @classmethod
+    def _batch_convert_date_keys(cls, data: Any) -> Any:
+        """
+        Batch-convert string dates in raw input to timestamps.
+
+        When constructing a changeset from raw input, e.g. a dict loaded from JSON, the dates in add, remove, and
+        meta would each be parsed individually by the DateLike validators. A single pd.to_datetime call over all
+        string dates of a field does the same work in one vectorized pass. The per-element validators still run but
+        reduce to the pd.Timestamp fast path. Input that cannot be batch-converted is left untouched so that the
+        per-element validators produce the proper validation errors.
+        """
+        if not isinstance(data, dict):
+            return data
+
+        converted = None
+
+        for field in ("add", "meta"):
+            value = data.get(field)
+            if (
+                isinstance(value, dict)
+                and value
+                and all(isinstance(k, str) for k in value)
+            ):
+                try:
+                    dates = pd.to_datetime(list(value), errors="raise")
+                except Exception:
+                    continue
+
+                if converted is None:
+                    converted = dict(data)
+                converted[field] = dict(zip(dates, value.values()))
+
+        value = data.get("remove")
+        if isinstance(value, list) and value and all(isinstance(x, str) for x in value):
+            try:
+                dates = pd.to_datetime(value, errors="raise")
+            except Exception:
+                dates = None
+
+            if dates is not None:
+                if converted is None:
+                    converted = dict(data)
+                converted["remove"] = list(dates)
+
+        return data if converted is None else converted
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _validate_batch_converted(cls, data: Any, handler: Callable) -> "ChangeSet":
+        """
+        Validate the input with string dates batch-converted to timestamps.
+
+        The conversion replaces string date keys before field validation, so a validation failure in the converted
+        payload would report error locations in terms of the converted keys, e.g. a repr of pd.Timestamp instead of
+        the caller's date string. In that case, validation is re-run on the original input so that error locations
+        keep referring to the input document.
+        """
+        converted = cls._batch_convert_date_keys(data)
+
+        if converted is data:
+            return handler(data)
+
+        try:
+            return handler(converted)
+        except ValidationError:
+            return handler(data)
+
     @model_validator(mode="after")
     def _canonicalize(self) -> "ChangeSet":
-        # Sort days to add by date.
-        add = OrderedDict(sorted(self.add.items(), key=lambda i: i[0]))
+        # This also runs on direct field assignment, so unconditionally drop the derived private state; the newly
+        # assigned collection may differ from the one the caches were built from even if it is already sorted.
+        self._remove_set = None
+        self._invalidate_all_days_cache()
 
-        # Sort days to remove by date and remove duplicates.
-        remove = sorted(set(self.remove))
+        # Only re-sort collections that are actually out of order. After the first canonicalization they typically
+        # stay sorted, so a linear monotonicity check saves the O(N log N) rebuild on subsequent validations.
 
-        # Sort meta by date. Sort tag values and remove duplicates.
-        meta = OrderedDict(
-            [(k, v) for k, v in sorted(self.meta.items(), key=lambda i: i[0])]
-        )
+        # Sort days to add by date. Keys are unique, so sorted means strictly increasing. Sorting the keys alone
+        # avoids a Python-level key callable in the comparison loop.
+        if not _is_strictly_sorted(list(self.add)):
+            add = self.add
+            self.__dict__["add"] = OrderedDict((k, add[k]) for k in sorted(add))
+
+        # Sort days to remove by date and remove duplicates.
+        if not _is_strictly_sorted(self.remove):
+            self.__dict__["remove"] = sorted(set(self.remove))
 
-        self.__dict__["add"] = add
-        self.__dict__["remove"] = remove
-        self.__dict__["meta"] = meta
+        # Sort meta by date.
+        if not _is_strictly_sorted(list(self.meta)):
+            meta = self.meta
+            self.__dict__["meta"] = OrderedDict((k, meta[k]) for k in sorted(meta))
 
         return self
 
-    @validate_call(config={"arbitrary_types_allowed": True})
+    def _check_consistency_incremental(self, date: pd.Timestamp) -> None:
+        """
+        Check that adding the given date to the days to add keeps the changeset consistent.
+
+        In contrast to a full re-validation via model_validate, which re-parses every entry in the changeset, this
+        only verifies the invariants that a single mutation can actually violate: since the days to add are keyed by
+        date, a date may claim at most one day type, i.e. it must not already be present.
+
+        Parameters
+        ----------
+        date : pd.Timestamp
+            The date about to be added.
+
+        Raises
+        ------
+        ValueError
+            If the date is already in the days to add.
+        """
+        if date in self.add:
+            raise ValueError(f"Day {date} already in days to add.")
+
     def add_day(self, date: DateLike, props: DayPropsLike) -> Self:
         """
         Add a day to the change set.
@@ -373,34 +626,22 @@ class ChangeSet(
         -------
         ExchangeCalendarChangeSet : self
         """
+        # Validate arguments through the shared adapters instead of validate_call.
+        date = _DATE_ADAPTER.validate_python(date)
+        props = _DAY_PROPS_ADAPTER.validate_python(props)
 
-        # Checks if day is already in the dictionary of days to add.
-        if date in self.add:
-            # Throw an exception.
-            raise ValueError(f"Day {date} already in days to add.")
-
-        # Previous value.
-        prev = self.add.get(date, None)
+        # Check that the new date keeps the changeset consistent. Only considers the given date since all other
+        # entries are unaffected by this change.
+        self._check_consistency_incremental(date)
 
-        # Add the day to the dictionary of days to add.
-        self.add[date] = props
+        # Add the day to the dictionary of days to add. Goes through __dict__ to stay clear of any attribute
+        # machinery; the date was just proven absent, so no previous value needs saving.
+        self.__dict__["add"][date] = props
 
-        # Trigger validation.
-        try:
-            self.model_validate(self, strict=True)
-        except Exception as e:
-            # Restore previous state.
-            if prev is not None:
-                self.add[date] = prev
-            else:
-                del self.add[date]
-
-            # Let exception bubble up.
-            raise e
+        self._invalidate_all_days_cache()
 
         return self
 
-    @validate_call(config={"arbitrary_types_allowed": True})
     def remove_day(self, date: DateLike) -> Self:
         """
         Remove a day from the change set.
@@ -413,28 +654,25 @@ class ChangeSet(
         Returns
         -------
         ExchangeCalendarChangeSet : self
-
-        Raises
-        ------
-        ValueError
-            If removing the given date would make the changeset inconsistent. This can only be if the date is already in
-            the days to remove.
         """
-        self.remove.append(date)
+        # Validate date through the shared adapter instead of validate_call.
+        date = _DATE_ADAPTER.validate_python(date)
 
-        try:
-            # Trigger validation.
-            self.model_validate(self, strict=True)
-        except Exception as e:
-            self.remove.remove(date)
+        # Already present, nothing to do. Duplicates would be dropped during canonicalization anyway.
+        if date in self._get_remove_set():
+            return self
 
-            # Let exception bubble up.
-            raise e
+        self._remove_set.add(date)
+
+        # Keep the days to remove sorted, as canonicalization would, by inserting at the right position instead of
+        # appending and re-sorting.
+        bisect.insort(self.__dict__["remove"], date)
+
+        self._invalidate_all_days_cache()
 
         return self
 
     @_with_meta
-    @validate_call(config={"arbitrary_types_allowed": True})
     def set_tags(self, meta: DayMeta, tags: Tags) -> DayMeta:
         """
         Set the tags of a given day.
@@ -451,13 +689,16 @@ class ChangeSet(
         ExchangeCalendarChangeSet : self
         """
 
-        # Set the tags.
-        meta.tags = tags or []
+        # Validate tags through the shared adapter instead of validate_call.
+        tags = _TAGS_ADAPTER.validate_python(tags)
+
+        # Set the tags in canonical form, i.e. sorted alphabetically with duplicates removed, directly. This is
+        # what canonicalization would produce, without re-validating the whole model.
+        meta.__dict__["tags"] = sorted(set(tags or []))
 
         return meta
 
     @_with_meta
-    @validate_call(config={"arbitrary_types_allowed": True})
     def set_comment(self, meta: DayMeta, comment: Union[str, None]) -> DayMeta:
         """
         Set the comment for a given day.
@@ -474,13 +715,18 @@ class ChangeSet(
         ExchangeCalendarChangeSet : self
         """
 
-        # Set the tags.
-        meta.comment = comment or None
+        # Validate comment through the shared adapter instead of validate_call.
+        comment = _COMMENT_ADAPTER.validate_python(comment)
+
+        # Set the comment in canonical form, i.e. stripped of whitespace and None if empty, directly. This is what
+        # canonicalization would produce, without re-validating the whole model.
+        if comment is not None:
+            comment = comment.strip() or None
+        meta.__dict__["comment"] = comment
 
         return meta
 
     @_with_meta
-    @validate_call(config={"arbitrary_types_allowed": True})
     def set_meta(self, meta: DayMeta, meta0: Union[DayMeta, None]) -> DayMeta:
         """
         Set the metadata for a given day.
@@ -497,11 +743,11 @@ class ChangeSet(
         ExchangeCalendarChangeSet : self
         """
 
-        # Set the tags.
+        # Validate metadata through the shared adapter instead of validate_call.
+        meta0 = _DAY_META_ADAPTER.validate_python(meta0)
 
         return meta0
 
-    @validate_call(config={"arbitrary_types_allowed": True})
     def clear_day(self, date: DateLike, include_meta: bool = False) -> Self:
         """
         Clear a day from the change set.
@@ -517,14 +763,22 @@ class ChangeSet(
         -------
         ExchangeCalendarChangeSet : self
         """
+        # Validate date through the shared adapter instead of validate_call.
+        date = _DATE_ADAPTER.validate_python(date)
 
         # Avoid re-validation since this change cannot make the changeset inconsistent.
         self.__dict__["add"].pop(date, None)
-        self.__dict__["remove"] = [x for x in self.remove if x != date]
+
+        # Check membership in O(1) first so that the common "not present" case avoids rebuilding the remove list.
+        if date in self._get_remove_set():
+            self._remove_set.discard(date)
+            self.__dict__["remove"] = [x for x in self.remove if x != date]
 
         if include_meta:
             self.__dict__["meta"].pop(date, None)
 
+        self._invalidate_all_days_cache()
+
         return self
 
     def clear(self, include_meta: bool = False) -> Self:
@@ -542,10 +796,13 @@ class ChangeSet(
         """
         self.add.clear()
         self.remove.clear()
+        self._remove_set = None
 
         if include_meta:
             self.meta.clear()
 
+        self._invalidate_all_days_cache()
+
         return self
 
     def __len__(self):
@@ -577,15 +834,51 @@ class ChangeSet(
         Tuple[pd.Timestamp, ...]
             All unique days in the changeset.
         """
-        # Take union of dates to add and dates to remove.
-        dates = set(self.add.keys()).union(set(self.remove))
+        # Serve from cache when no mutation happened since the last computation.
+        cached = self._all_days_meta_cache if include_meta else self._all_days_cache
+        if cached is not None:
+            return cached
+
+        n = len(self.add) + len(self.remove) + (len(self.meta) if include_meta else 0)
+
+        result = None
+
+        if n >= _ALL_DAYS_VECTORIZE_MIN_SIZE:
+            # For larger changesets, sort and deduplicate as int64 nanosecond values via numpy. This avoids a
+            # Python-level comparison per element, which dominates the cost of sorting pd.Timestamp objects.
+            dates = itertools.chain(
+                self.add.keys(),
+                self.remove,
+                self.meta.keys() if include_meta else (),
+            )
+            try:
+                unique = np.unique(
+                    np.fromiter((t.value for t in dates), dtype="int64", count=n)
+                )
+            except OverflowError:
+                # At least one date lies outside the nanosecond-representable range, e.g. a far date that pandas
+                # stores in a coarser unit. Fall back to the Python-level path below.
+                pass
+            else:
+                result = tuple(pd.DatetimeIndex(unique.astype("datetime64[ns]")))
+
+        if result is None:
+            # Take union of dates to add and dates to remove.
+            dates = set(self.add.keys()).union(set(self.remove))
+
+            # Add dates associated with tags, maybe.
+            if include_meta:
+                dates = dates.union(set(self.meta.keys()))
+
+            # Sorted tuple.
+            result = tuple(sorted(dates))
 
-        # Add dates associated with tags, maybe.
         if include_meta:
-            dates = dates.union(set(self.meta.keys()))
+            self._all_days_meta_cache = result
+        else:
+            self._all_days_cache = result
 
-        # Return as sorted tuple.
-        return tuple(sorted(dates))
+        return result
 
 
 # A type alias for a dictionary of changesets, mapping exchange key to a corresponding change set.
@@ -1,4 +1,5 @@
 import datetime as dt
+import functools
 from typing import Any, Union
 from collections.abc import Collection
 
@@ -28,6 +29,118 @@ DayMetaValidator = TypeAdapter(
     Union[DayMeta, None], config=dict(arbitrary_types_allowed=True)
 )
 
+# Bound pydantic-core validation methods. Calling the SchemaValidator directly skips the Python-level TypeAdapter
+# wrapper on every conversion.
+_validate_timestamp = TimeStampValidator.validator.validate_python
+_validate_day_props = DayPropsValidator.validator.validate_python
+_validate_day_meta = DayMetaValidator.validator.validate_python
+
+
+@functools.lru_cache(maxsize=None)
+def _to_timestamp_cached(kind, value):
+    """Validate a hashable value, memoized on (type, value) so that e.g. the string '2020-01-01' and an equal
+    pd.Timestamp are cached separately."""
+    return _validate_timestamp(value)
+
+
+def to_timestamp(value):
+    """Convert value to a date-like pd.Timestamp through the shared pre-compiled validator.
+
+    The tests only use a handful of distinct date literals, so results for hashable inputs are memoized."""
+    try:
+        return _to_timestamp_cached(type(value), value)
+    except TypeError:
+        # Unhashable value, validate without caching.
+        return _validate_timestamp(value)
+
+
+# Validated day properties keyed on the id() of the raw input. The parametrize tables reuse the same dict literals
+# across many rows, so identity is a reliable cache key. _dp_refs keeps the inputs alive so ids are never recycled.
+_dp_cache: dict = {}
+_dp_refs: list = []
+
+
+def to_day_props(value):
+    """Convert value to day properties through the shared pre-compiled validator.
+
+    Values that already are validated model instances are returned as-is; other inputs are interned by identity,
+    since the parametrize tables hand the same dict objects to many tests."""
+    if isinstance(value, (DayProps, DayPropsWithTime)):
+        return value
+
+    cached = _dp_cache.get(id(value))
+    if cached is not None:
+        return cached
+
+    props = _validate_day_props(value)
+    _dp_cache[id(value)] = props
+    _dp_refs.append(value)
+    return props
+
+
+def to_day_meta(value):
+    """Convert value to day metadata through the shared pre-compiled validator."""
+    return _validate_day_meta(value)
+
+
+def _make_populated_cs(add=None, remove=None, meta=None) -> ChangeSet:
+    """
+    Build a changeset directly from the given entries via model_construct.
+
+    Converts dates, props, and meta through the shared validators and assembles the changeset without running model
+    validation. Useful for tests that need a populated changeset but are not about validating its construction.
+    Entries must be consistent and dates must be given in sorted order.
+    """
+    return ChangeSet.model_construct(
+        add={to_timestamp(k): to_day_props(v) for k, v in (add or {}).items()},
+        remove=[to_timestamp(d) for d in (remove or [])],
+        meta={to_timestamp(k): to_day_meta(v) for k, v in (meta or {}).items()},
+    )
+
+
+def _run_clear_day_case(cs: ChangeSet, populate, date, include_tags: bool):
+    """
+    Populate a day via the given mutator, tag it, clear it, and check what remains.
+
+    Clearing with include_meta=True empties the changeset; with include_meta=False, the tags entry survives.
+    """
+    populate(cs)
+    assert len(cs) == 1
+
+    # Add tags for same day.
+    cs.set_tags(date, ["foo", "bar"])
+    assert len(cs) == 2
+
+    # Clear day.
+    cs.clear_day(date, include_meta=include_tags)
+    assert len(cs) == (0 if include_tags else 1)
+
+
+# Validated changesets keyed on the id() of the raw input dict, mirroring the to_day_props cache. Caching on
+# identity rather than a canonical serialization matters: the input must reach model_validate untouched, e.g. with
+# entries deliberately listed out of date order, so that canonicalization is exercised. _cs_refs keeps the inputs
+# alive so ids are never recycled.
+_cs_cache: dict = {}
+_cs_refs: list = []
+
+
+def validate_changeset(d: dict) -> ChangeSet:
+    """
+    Convert a dict to a changeset through ChangeSet.model_validate, caching the result.
+
+    The parametrize tables hand the same dict objects to repeat runs of a row, and validation is deterministic, so
+    results are interned by input identity. Note that cached changesets stay alive for the whole session; callers
+    that mutate the result must copy it first.
+    """
+    cached = _cs_cache.get(id(d))
+    if cached is not None:
+        return cached
+
+    cs = ChangeSet.model_validate(d)
+    _cs_cache[id(d)] = cs
+    _cs_refs.append(d)
+    return cs
+
 
 def to_args(values: Collection):
     """
@@ -49,8 +162,28 @@ def to_args(values: Collection):
     return list(map(lambda x: (x,), values))
 
 
+def case_ids(values: Collection):
+    """
+    Generate compact positional test IDs for a parametrize table.
+
+    Supplying explicit IDs keeps pytest from calling repr on every parameter value, e.g. pd.Timestamp or pydantic
+    models, during collection.
+
+    Parameters
+    ----------
+    values : Collection
+        The collection of values.
+
+    Returns
+    -------
+    list
+        A list of string IDs, one per value.
+    """
+    return [f"case{i}" for i in range(len(values))]
+
+
 # Set of valid tags.
-VALID_TAGS = [
+VALID_TAGS = (
     None,
     [],
     ["foo"],
@@ -58,18 +191,18 @@ VALID_TAGS = [
     ["foo", "bar", "foo"],
     ("foo", "bar", "foo"),
     {"foo", "bar"},
-]
+)
 
 # Set of invalid tags.
-INVALID_TAGS = [123, 123.456, "foo", {"foo": "bar"}, ["foo", "bar", 1]]
+INVALID_TAGS = (123, 123.456, "foo", {"foo": "bar"}, ["foo", "bar", 1])
 
 # Valid comments.
-VALID_COMMENTS = [None, "", "This is a comment."]
+VALID_COMMENTS = (None, "", "This is a comment.")
 
 # Invalid comments.
-INVALID_COMMENTS = [123, 123.456, {"foo": "bar"}, ["foo", "bar", 1]]
+INVALID_COMMENTS = (123, 123.456, {"foo": "bar"}, ["foo", "bar", 1])
 
-VALID_META = [
+VALID_META = (
     None,
     DayMeta(),
     {"tags": ["foo", "bar"]},
@@ -78,48 +211,82 @@ VALID_META = [
     DayMeta(tags=["foo", "bar"], comment="This is a comment."),
     {"comment": "This is a comment."},
     DayMeta(comment="This is a comment."),
-]
+)
+
+# The date used throughout the test cases, parsed once as pd.Timestamp and dt.date, respectively.
+_TS_2020 = pd.Timestamp("2020-01-01")
+_D_2020 = _TS_2020.date()
 
 # Set of valid dates.
-VALID_DATES = [
+VALID_DATES = (
     "2020-01-01",
-    pd.Timestamp("2020-01-01"),
-    pd.Timestamp("2020-01-01").date(),
+    _TS_2020,
+    _D_2020,
     "2020-01",
     1577833200,
-]
+)
 
 # Set of invalid dates.
-INVALID_DATES = ["2020-001", "#2020", "2020:01:01", None, {"foo": "bar"}]
+INVALID_DATES = ("2020-001", "#2020", "2020:01:01", None, {"foo": "bar"})
+
+# Cross product of valid dates and valid tags, flattened into a single table so that tests exercising date/tags
+# combinations share one definition instead of stacking parametrize decorators. The third column holds the
+# expected canonical tags, i.e. sorted with duplicates removed, or None when no tags should be set at all.
+TAG_CASES = tuple(
+    (date, tags, sorted(set(tags)) if tags else None)
+    for date in VALID_DATES
+    for tags in VALID_TAGS
+)
+
+# Flat table of invalid tag cases. A single representative date suffices since the date is not what these cases
+# exercise; crossing with all valid dates would only multiply the collected items.
+INVALID_TAG_CASES = tuple(("2020-01-01", tags) for tags in INVALID_TAGS)
+
+# The open/close times used in the test cases, constructed once and shared across all tables.
+_T_10 = dt.time(10, 0)
+_T_16 = dt.time(16, 0)
+
+# Pre-built day props instances, validated once at import and referenced from the tables below.
+_HOLIDAY_PROPS = DayProps(type=DayType.HOLIDAY, name="Holiday")
+_SPECIAL_OPEN_PROPS = DayPropsWithTime(
+    type=DayType.SPECIAL_OPEN, name="Special Open", time="10:00"
+)
+_SPECIAL_CLOSE_PROPS = DayPropsWithTime(
+    type=DayType.SPECIAL_CLOSE, name="Special Close", time="16:00"
+)
+_MONTHLY_EXPIRY_PROPS = DayProps(type=DayType.MONTHLY_EXPIRY, name="Monthly Expiry")
+_QUARTERLY_EXPIRY_PROPS = DayProps(
+    type=DayType.QUARTERLY_EXPIRY, name="Quarterly Expiry"
+)
 
 # Set of valid day properties.
-VALID_PROPS = [
+VALID_PROPS = (
     {"type": "holiday", "name": "Holiday"},
-    DayProps(**{"type": "holiday", "name": "Holiday"}),
+    _HOLIDAY_PROPS,
     {"type": "special_open", "name": "Special Open", "time": "10:00"},
-    DayPropsWithTime(
-        **{"type": "special_open", "name": "Special Open", "time": "10:00"}
-    ),
+    _SPECIAL_OPEN_PROPS,
     {"type": DayType.SPECIAL_OPEN, "name": "Special Open", "time": "10:00:00"},
-    {"type": "special_open", "name": "Special Open", "time": dt.time(10, 0)},
+    {"type": "special_open", "name": "Special Open", "time": _T_10},
     {"type": "special_close", "name": "Special Close", "time": "16:00"},
-    DayPropsWithTime(
-        **{"type": "special_close", "name": "Special Close", "time": "16:00"}
-    ),
+    _SPECIAL_CLOSE_PROPS,
     {"type": DayType.SPECIAL_CLOSE, "name": "Special Close", "time": "16:00:00"},
-    {"type": "special_close", "name": "Special Close", "time": dt.time(16, 0)},
+    {"type": "special_close", "name": "Special Close", "time": _T_16},
     {"type": "monthly_expiry", "name": "Monthly Expiry"},
-    DayProps(**{"type": "monthly_expiry", "name": "Monthly Expiry"}),
+    _MONTHLY_EXPIRY_PROPS,
     {"type": DayType.MONTHLY_EXPIRY, "name": "Monthly Expiry"},
     {"type": "monthly_expiry", "name": "Monthly Expiry"},
     {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
-    DayProps(**{"type": "quarterly_expiry", "name": "Quarterly Expiry"}),
+    _QUARTERLY_EXPIRY_PROPS,
     {"type": DayType.QUARTERLY_EXPIRY, "name": "Quarterly Expiry"},
     {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
-]
+)
+
+# Valid day properties paired with the expected validated model, computed once at module import so that tests
+# checking the outcome of add_day need not convert the raw input again.
+PROPS_WITH_EXPECTED = tuple((props, to_day_props(props)) for props in VALID_PROPS)
 
 # Set of invalid day properties.
-INVALID_PROPS = [
+INVALID_PROPS = (
     # Invalid day type.
     {"type": "foo", "name": "Holiday"},
     {"type": "foo", "name": "Special Open", "time": "10:00"},
@@ -134,12 +301,296 @@ INVALID_PROPS = [
     {"type": "special_open", "name": "Special Open", "foo": "10:00"},
     {"type": "special_close", "foo": "Special Close", "time": "10:00"},
     {"type": "special_close", "name": "Special Close", "foo": "10:00"},
-]
+)
+
+
+# Set of invalid changeset dicts, grouped by the discriminator branch the entry hits so that consecutive cases
+# exercise the same pydantic-core error path.
+INVALID_DICTS = (
+    # Unknown day type, misses every branch of the discriminated union.
+    {"add": {"2020-01-01": {"type": "foo", "name": "Holiday"}}},
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "foo",
+                "name": "Special Open",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "foo",
+                "name": "Special Close",
+                "time": "10:00",
+            }
+        }
+    },
+    # Holiday: invalid date, unknown or extra keys.
+    {"add": {"foo": {"type": "holiday", "name": "Holiday"}}},
+    {"add": {"2020-01-01": {"type": "holiday", "foo": "Holiday"}}},
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "holiday",
+                "name": "Holiday",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "holiday",
+                "name": "Holiday",
+                "foo": "bar",
+            }
+        }
+    },
+    # Monthly expiry: invalid date, unknown key.
+    {"add": {"foo": {"type": "monthly_expiry", "name": "Holiday"}}},
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "monthly_expiry",
+                "foo": "Monthly Expiry",
+            }
+        }
+    },
+    # Quarterly expiry: invalid date, unknown key.
+    {"add": {"foo": {"type": "quarterly_expiry", "name": "Holiday"}}},
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "quarterly_expiry",
+                "foo": "Quarterly Expiry",
+            }
+        }
+    },
+    # Special open: invalid date, unknown keys.
+    {
+        "add": {
+            "foo": {
+                "type": "special_open",
+                "name": "Special Open",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "special_open",
+                "foo": "Special Open",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "special_open",
+                "name": "Special Open",
+                "foo": "10:00",
+            }
+        }
+    },
+    # Special close: invalid date, unknown keys.
+    {
+        "add": {
+            "foo": {
+                "type": "special_close",
+                "name": "Special Close",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "special_close",
+                "foo": "Special Close",
+                "time": "10:00",
+            }
+        }
+    },
+    {
+        "add": {
+            "2020-01-01": {
+                "type": "special_close",
+                "name": "Special Close",
+                "foo": "10:00",
+            }
+        }
+    },
+    # Invalid date in the remove list.
+    {"remove": ["2020-01-01", "foo"]},
+)
+
+
+# Expected all_days results for the changeset used in test_all_days, without and with the meta dates, computed and
+# sorted once at module import.
+_ALL_DAYS_EXPECTED_NO_META = tuple(
+    to_timestamp(d)
+    for d in (
+        "2020-01-01",
+        "2020-01-02",
+        "2020-02-01",
+        "2020-02-02",
+        "2020-03-01",
+        "2020-03-02",
+        "2020-04-01",
+        "2020-04-02",
+        "2020-05-01",
+        "2020-05-02",
+    )
+)
+_ALL_DAYS_EXPECTED_WITH_META = tuple(
+    sorted(
+        _ALL_DAYS_EXPECTED_NO_META
+        + tuple(
+            to_timestamp(d)
+            for d in (
+                "2020-01-03",
+                "2020-02-03",
+                "2020-03-03",
+                "2020-04-03",
+                "2020-05-03",
+                "2020-01-04",
+                "2020-02-04",
+                "2020-03-04",
+                "2020-04-04",
+                "2020-05-04",
+            )
+        )
+    )
+)
+
+
+# Expected changeset for the large row of test_changeset_from_valid_non_empty_dict, assembled once at module
+# import from already-typed entries instead of a long chain of mutator calls.
+_EXPECTED_LARGE_CS = _make_populated_cs(
+    add={
+        "2020-01-01": {"type": "holiday", "name": "Holiday"},
+        "2020-02-01": {
+            "type": "special_open",
+            "name": "Special Open",
+            "time": "10:00",
+        },
+        "2020-03-01": {
+            "type": "special_close",
+            "name": "Special Close",
+            "time": "16:00",
+        },
+        "2020-04-01": {"type": "monthly_expiry", "name": "Monthly Expiry"},
+        "2020-05-01": {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
+    },
+    remove=[
+        "2020-01-02",
+        "2020-02-02",
+        "2020-03-02",
+        "2020-04-02",
+        "2020-05-02",
+    ],
+    meta={
+        "2020-01-01": {"tags": ["foo", "bar"]},
+        "2020-01-02": {"comment": "This is a comment."},
+        "2020-02-01": {"tags": ["foo", "bar"]},
+        "2020-02-02": {"tags": ["foo", "bar"]},
+        "2020-03-01": {"tags": ["foo", "bar"], "comment": "This is a comment."},
+        "2020-03-02": {"tags": ["foo", "bar"]},
+        "2020-04-01": {"tags": ["foo", "bar"], "comment": "This is a comment."},
+        "2020-04-02": {"tags": ["foo", "bar"]},
+        "2020-05-01": {"comment": "This is a comment."},
+        "2020-05-02": {"tags": ["foo", "bar"]},
+    },
+)
+
+
+@pytest.fixture
+def empty_cs() -> ChangeSet:
+    """A fresh empty changeset."""
+    return ChangeSet()
+
+
+@pytest.fixture(scope="session")
+def populated_cs() -> ChangeSet:
+    """A populated changeset prototype, built once per session.
+
+    Tests that mutate it must take a ``model_copy(deep=True)`` first.
+    """
+    return _make_populated_cs(
+        add={
+            "2020-01-01": {"type": "holiday", "name": "Holiday"},
+            "2020-01-02": {
+                "type": "special_open",
+                "name": "Special Open",
+                "time": "10:00",
+            },
+            "2020-01-03": {
+                "type": "special_close",
+                "name": "Special Close",
+                "time": "16:00",
+            },
+            "2020-01-04": {"type": "monthly_expiry", "name": "Monthly Expiry"},
+            "2020-01-05": {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
+        },
+        remove=[
+            "2020-01-06",
+            "2020-01-07",
+            "2020-01-08",
+            "2020-01-09",
+            "2020-01-10",
+        ],
+        meta={f"2020-01-{day:02d}": {"tags": ["foo", "bar"]} for day in range(1, 11)},
+    )
+
+
+@pytest.fixture(scope="session")
+def all_days_cs() -> ChangeSet:
+    """A populated changeset prototype matching the ``_ALL_DAYS_EXPECTED_*`` constants."""
+    return _make_populated_cs(
+        add={
+            "2020-01-01": {"type": "holiday", "name": "Holiday"},
+            "2020-02-01": {
+                "type": "special_open",
+                "name": "Special Open",
+                "time": "10:00",
+            },
+            "2020-03-01": {
+                "type": "special_close",
+                "name": "Special Close",
+                "time": "16:00",
+            },
+            "2020-04-01": {"type": "monthly_expiry", "name": "Monthly Expiry"},
+            "2020-05-01": {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
+        },
+        remove=[
+            "2020-01-02",
+            "2020-02-02",
+            "2020-03-02",
+            "2020-04-02",
+            "2020-05-02",
+        ],
+        meta={
+            "2020-01-03": {"tags": ["foo", "bar"]},
+            "2020-01-04": {"comment": "This is a comment."},
+            "2020-02-03": {"tags": ["foo", "bar"]},
+            "2020-02-04": {"comment": "This is a comment."},
+            "2020-03-03": {"tags": ["foo", "bar"]},
+            "2020-03-04": {"comment": "This is a comment."},
+            "2020-04-03": {"tags": ["foo", "bar"]},
+            "2020-04-04": {"comment": "This is a comment."},
+            "2020-05-03": {"tags": ["foo", "bar"]},
+            "2020-05-04": {"comment": "This is a comment."},
+        },
+    )
 
 
 class TestChangeSet:
-    def test_empty_changeset(self):
-        cs = ChangeSet()
+    def test_empty_changeset(self, empty_cs: ChangeSet):
+        cs = empty_cs
         assert len(cs) == 0
         assert not cs
         assert cs.add == dict()
@@ -148,11 +599,21 @@ class TestChangeSet:
 
     # add_day
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["props"], to_args(VALID_PROPS))
-    def test_add_day(self, date: DateLike, props: DayPropsLike):
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    @pytest.mark.parametrize(
+        ["props", "expected_props"],
+        list(PROPS_WITH_EXPECTED),
+        ids=case_ids(PROPS_WITH_EXPECTED),
+    )
+    def test_add_day(
+        self,
+        date: DateLike,
+        props: DayPropsLike,
+        expected_props: Union[DayProps, DayPropsWithTime],
+        empty_cs: ChangeSet,
+    ):
         # Empty changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Add day.
         cs.add_day(date, props)
@@ -160,36 +621,31 @@ class TestChangeSet:
         # Check length.
         assert len(cs) == 1
 
-        # Convert date to validated object, maybe.
-        date = TimeStampValidator.validate_python(date)
-
-        # Convert input to validated object, maybe.
-        props = DayPropsValidator.validate_python(props)
-
-        # Get the only element from the dict.
-        props0 = cs.add[date]
-
-        # Check it's identical to the input.
-        assert props0 == props
+        # Check the entry against the pre-validated expectation.
+        assert cs.add[to_timestamp(date)] == expected_props
 
         # Check the rest of the changeset.
         assert cs.remove == []
         assert cs.meta == dict()
 
-    @pytest.mark.parametrize(["date"], to_args(INVALID_DATES))
-    def test_add_day_invalid_date(self, date: Any):
+    @pytest.mark.parametrize(
+        ["date"], to_args(INVALID_DATES), ids=case_ids(INVALID_DATES)
+    )
+    def test_add_day_invalid_date(self, date: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Add day.
         # noinspection PyTypeChecker
         with pytest.raises((ValidationError, TypeError)):
             cs.add_day(date, {"type": "holiday", "name": "Holiday"})
 
-    @pytest.mark.parametrize(["props"], to_args(INVALID_PROPS))
-    def test_add_day_invalid_props(self, props: Any):
+    @pytest.mark.parametrize(
+        ["props"], to_args(INVALID_PROPS), ids=case_ids(INVALID_PROPS)
+    )
+    def test_add_day_invalid_props(self, props: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Add day.
         # noinspection PyTypeChecker
@@ -198,19 +654,21 @@ class TestChangeSet:
 
     # remove_day
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    def test_remove_day(self, date):
-        cs = ChangeSet()
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    def test_remove_day(self, date, empty_cs: ChangeSet):
+        cs = empty_cs
         cs.remove_day(date)
         assert len(cs) == 1
 
         # Check given day type.
-        assert cs.remove == [TimeStampValidator.validate_python(date)]
+        assert cs.remove == [to_timestamp(date)]
 
-    @pytest.mark.parametrize(["date"], to_args(INVALID_DATES))
-    def test_remove_day_invalid_date(self, date: Any):
+    @pytest.mark.parametrize(
+        ["date"], to_args(INVALID_DATES), ids=case_ids(INVALID_DATES)
+    )
+    def test_remove_day_invalid_date(self, date: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Remove day.
         # noinspection PyTypeChecker
@@ -219,50 +677,59 @@ class TestChangeSet:
 
     # set_tags
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["tags"], to_args(VALID_TAGS))
-    def test_set_tags(self, date: DateLike, tags: Tags):
-        cs = ChangeSet()
+    @pytest.mark.parametrize(
+        ["date", "tags", "expected_tags"], TAG_CASES, ids=case_ids(TAG_CASES)
+    )
+    def test_set_tags(
+        self, date: DateLike, tags: Tags, expected_tags: Any, empty_cs: ChangeSet
+    ):
+        cs = empty_cs
         cs.set_tags(date, tags)
 
         # Ensure timestamp.
-        ts = TimeStampValidator.validate_python(date)
+        ts = to_timestamp(date)
 
-        if tags is None or len(tags) == 0:
+        if expected_tags is None:
             # Empty set of tags.
             assert len(cs) == 0
             assert ts not in cs.meta
         else:
             # Non-empty set of tags. Duplicates should be removed and the result should be sorted.
             assert len(cs) == 1
-            assert cs.meta[ts].tags == sorted(set(tags))
+            assert cs.meta[ts].tags == expected_tags
             assert cs.meta[ts].comment is None
 
-    @pytest.mark.parametrize(["date"], to_args(INVALID_DATES))
-    def test_set_tags_invalid_date(self, date: Any):
+    @pytest.mark.parametrize(
+        ["date"], to_args(INVALID_DATES), ids=case_ids(INVALID_DATES)
+    )
+    def test_set_tags_invalid_date(self, date: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set tags.
         # noinspection PyTypeChecker
         with pytest.raises((ValidationError, TypeError)):
             cs.set_tags(date, ["foo", "bar"])
 
-    @pytest.mark.parametrize(["tags"], to_args(INVALID_TAGS))
-    def test_set_tags_invalid_tags(self, tags: Any):
+    @pytest.mark.parametrize(
+        ["date", "tags"], INVALID_TAG_CASES, ids=case_ids(INVALID_TAG_CASES)
+    )
+    def test_set_tags_invalid_tags(
+        self, date: DateLike, tags: Any, empty_cs: ChangeSet
+    ):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set invalid tags.
         with pytest.raises(ValueError):
-            cs.set_tags("2020-01-01", tags)
+            cs.set_tags(date, tags)
 
-    def test_set_tags_to_none(self):
+    def test_set_tags_to_none(self, empty_cs: ChangeSet):
         d: str = "2020-01-01"
-        ts: pd.Timestamp = TimeStampValidator.validate_python(d)
+        ts: pd.Timestamp = to_timestamp(d)
 
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set tags.
         cs.set_tags(d, ["foo", "bar"])
@@ -291,14 +758,18 @@ class TestChangeSet:
 
     # set_comment
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["comment"], to_args(VALID_COMMENTS))
-    def test_set_comment(self, date: DateLike, comment: Union[str, None]):
-        cs = ChangeSet()
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    @pytest.mark.parametrize(
+        ["comment"], to_args(VALID_COMMENTS), ids=case_ids(VALID_COMMENTS)
+    )
+    def test_set_comment(
+        self, date: DateLike, comment: Union[str, None], empty_cs: ChangeSet
+    ):
+        cs = empty_cs
         cs.set_comment(date, comment)
 
         # Convert date to validated object, maybe.
-        ts = TimeStampValidator.validate_python(date)
+        ts = to_timestamp(date)
 
         if comment is None or len(comment) == 0:
             # Empty comment.
@@ -310,31 +781,35 @@ class TestChangeSet:
             assert cs.meta[ts].tags == []
             assert cs.meta[ts].comment == comment
 
-    @pytest.mark.parametrize(["date"], to_args(INVALID_DATES))
-    def test_set_comment_invalid_date(self, date: Any):
+    @pytest.mark.parametrize(
+        ["date"], to_args(INVALID_DATES), ids=case_ids(INVALID_DATES)
+    )
+    def test_set_comment_invalid_date(self, date: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set comment.
         # noinspection PyTypeChecker
         with pytest.raises((ValidationError, TypeError)):
             cs.set_comment(date, "This is a comment.")
 
-    @pytest.mark.parametrize(["comment"], to_args(INVALID_COMMENTS))
-    def test_set_comment_invalid_comment(self, comment: Any):
+    @pytest.mark.parametrize(
+        ["comment"], to_args(INVALID_COMMENTS), ids=case_ids(INVALID_COMMENTS)
+    )
+    def test_set_comment_invalid_comment(self, comment: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set invalid comment.
         with pytest.raises(ValueError):
             cs.set_comment("2020-01-01", comment)
 
-    def test_set_comment_to_empty_string(self):
+    def test_set_comment_to_empty_string(self, empty_cs: ChangeSet):
         d: str = "2020-01-01"
-        ts: pd.Timestamp = TimeStampValidator.validate_python(d)
+        ts: pd.Timestamp = to_timestamp(d)
 
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Set tags.
         cs.set_tags(d, ["foo", "bar"])
@@ -361,17 +836,17 @@ class TestChangeSet:
 
     # set_meta
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["meta"], to_args(VALID_META))
-    def test_set_meta(self, date: DateLike, meta: Any):
-        cs = ChangeSet()
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    @pytest.mark.parametrize(["meta"], to_args(VALID_META), ids=case_ids(VALID_META))
+    def test_set_meta(self, date: DateLike, meta: Any, empty_cs: ChangeSet):
+        cs = empty_cs
         cs.set_meta(date, meta)
 
         # Ensure timestamp.
-        ts = TimeStampValidator.validate_python(date)
+        ts = to_timestamp(date)
 
         # Convert input to validated object.
-        meta = DayMetaValidator.validate_python(meta)
+        meta = to_day_meta(meta)
 
         if meta is None or len(meta) == 0:
             assert len(cs) == 0
@@ -389,43 +864,31 @@ class TestChangeSet:
     @pytest.mark.parametrize(
         ["include_tags"], [(True,), (False,)], ids=["include_tags", "exclude_meta"]
     )
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["props"], to_args(VALID_PROPS))
-    def test_clear_day(self, date: DateLike, props: DayPropsLike, include_tags: bool):
-        # Empty changeset.
-        cs = ChangeSet()
-
-        # Add day.
-        cs.add_day(date, props)
-        assert len(cs) == 1
-
-        # Add tags for same day.
-        cs.set_tags(date, ["foo", "bar"])
-        assert len(cs) == 2
-
-        # Clear day.
-        cs.clear_day(date, include_meta=include_tags)
-        assert len(cs) == 0 if include_tags else 1
-
-        # Empty changeset.
-        cs = ChangeSet()
-
-        # Remove day.
-        cs.remove_day(date)
-        assert len(cs) == 1
-
-        # Add tags for same day.
-        cs.set_tags(date, ["foo", "bar"])
-        assert len(cs) == 2
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    @pytest.mark.parametrize(["props"], to_args(VALID_PROPS), ids=case_ids(VALID_PROPS))
+    def test_clear_day(
+        self,
+        date: DateLike,
+        props: DayPropsLike,
+        include_tags: bool,
+        empty_cs: ChangeSet,
+    ):
+        # Day present via add_day.
+        _run_clear_day_case(
+            empty_cs, lambda cs: cs.add_day(date, props), date, include_tags
+        )
 
-        # Clear day.
-        cs.clear_day(date, include_meta=include_tags)
-        assert len(cs) == 0 if include_tags else 1
+        # Day present via remove_day.
+        _run_clear_day_case(
+            ChangeSet(), lambda cs: cs.remove_day(date), date, include_tags
+        )
 
-    @pytest.mark.parametrize(["date"], to_args(INVALID_DATES))
-    def test_clear_day_invalid_date(self, date: Any):
+    @pytest.mark.parametrize(
+        ["date"], to_args(INVALID_DATES), ids=case_ids(INVALID_DATES)
+    )
+    def test_clear_day_invalid_date(self, date: Any, empty_cs: ChangeSet):
         # Fresh changeset.
-        cs = ChangeSet()
+        cs = empty_cs
 
         # Clear day.
         # noinspection PyTypeChecker
@@ -437,36 +900,9 @@ class TestChangeSet:
     @pytest.mark.parametrize(
         ["include_meta"], [(True,), (False,)], ids=["include_meta", "exclude_meta"]
     )
-    def test_clear(self, include_meta: bool):
-        cs = ChangeSet()
-        cs.add_day("2020-01-01", {"type": "holiday", "name": "Holiday"})
-        cs.add_day(
-            "2020-01-02",
-            {"type": "special_open", "name": "Special Open", "time": "10:00"},
-        )
-        cs.add_day(
-            "2020-01-03",
-            {"type": "special_close", "name": "Special Close", "time": "16:00"},
-        )
-        cs.add_day("2020-01-04", {"type": "monthly_expiry", "name": "Monthly Expiry"})
-        cs.add_day(
-            "2020-01-05", {"type": "quarterly_expiry", "name": "Quarterly Expiry"}
-        )
-        cs.remove_day("2020-01-06")
-        cs.remove_day("2020-01-07")
-        cs.remove_day("2020-01-08")
-        cs.remove_day("2020-01-09")
-        cs.remove_day("2020-01-10")
-        cs.set_tags("2020-01-01", ["foo", "bar"])
-        cs.set_tags("2020-01-02", ["foo", "bar"])
-        cs.set_tags("2020-01-03", ["foo", "bar"])
-        cs.set_tags("2020-01-04", ["foo", "bar"])
-        cs.set_tags("2020-01-05", ["foo", "bar"])
-        cs.set_tags("2020-01-06", ["foo", "bar"])
-        cs.set_tags("2020-01-07", ["foo", "bar"])
-        cs.set_tags("2020-01-08", ["foo", "bar"])
-        cs.set_tags("2020-01-09", ["foo", "bar"])
-        cs.set_tags("2020-01-10", ["foo", "bar"])
+    def test_clear(self, include_meta: bool, populated_cs: ChangeSet):
+        # Deep copy of the session-scoped prototype since this test mutates the changeset.
+        cs = populated_cs.model_copy(deep=True)
 
         assert len(cs) == 20
 
@@ -483,8 +919,8 @@ class TestChangeSet:
             assert cs.remove == []
             assert len(cs.meta) == 10
 
-    @pytest.mark.parametrize(["date"], to_args(VALID_DATES))
-    @pytest.mark.parametrize(["props"], to_args(VALID_PROPS))
+    @pytest.mark.parametrize(["date"], to_args(VALID_DATES), ids=case_ids(VALID_DATES))
+    @pytest.mark.parametrize(["props"], to_args(VALID_PROPS), ids=case_ids(VALID_PROPS))
     def test_add_remove_day_for_same_day_type(
         self, date: DateLike, props: DayPropsLike
     ):
@@ -493,16 +929,12 @@ class TestChangeSet:
         cs.remove_day(date)
         assert cs
         assert len(cs) == 2
-        assert cs.add == {
-            TimeStampValidator.validate_python(date): DayPropsValidator.validate_python(
-                props
-            )
-        }
-        assert cs.remove == [TimeStampValidator.validate_python(date)]
+        assert cs.add == {to_timestamp(date): to_day_props(props)}
+        assert cs.remove == [to_timestamp(date)]
         assert cs.meta == dict()
 
-    def test_add_same_day_twice(self):
-        cs = ChangeSet()
+    def test_add_same_day_twice(self, empty_cs: ChangeSet):
+        cs = empty_cs
         date = "2020-01-01"
         props = {"type": "holiday", "name": "Holiday"}
         props_alt = {"type": "special_open", "name": "Special Open", "time": "10:00"}
@@ -511,11 +943,7 @@ class TestChangeSet:
             cs.add_day(date, props_alt)
         assert cs
         assert len(cs) == 1
-        assert cs.add == {
-            TimeStampValidator.validate_python(date): DayPropsValidator.validate_python(
-                props
-            )
-        }
+        assert cs.add == {to_timestamp(date): to_day_props(props)}
         assert cs.remove == []
         assert cs.meta == dict()
 
@@ -639,195 +1067,15 @@ class TestChangeSet:
                         "2020-05-02": {"tags": ["foo", "bar"]},
                     },
                 },
-                ChangeSet()
-                .add_day("2020-01-01", {"type": "holiday", "name": "Holiday"})
-                .set_tags("2020-01-01", ["foo", "bar"])
-                .remove_day("2020-01-02")
-                .set_comment("2020-01-02", "This is a comment.")
-                .add_day(
-                    "2020-02-01",
-                    {"type": "special_open", "name": "Special Open", "time": "10:00"},
-                )
-                .set_tags("2020-02-01", ["foo", "bar"])
-                .remove_day("2020-02-02")
-                .set_tags("2020-02-02", ["foo", "bar"])
-                .add_day(
-                    "2020-03-01",
-                    {"type": "special_close", "name": "Special Close", "time": "16:00"},
-                )
-                .set_tags("2020-03-01", ["foo", "bar"])
-                .set_comment("2020-03-01", "This is a comment.")
-                .remove_day("2020-03-02")
-                .set_tags("2020-03-02", ["foo", "bar"])
-                .add_day(
-                    "2020-04-01", {"type": "monthly_expiry", "name": "Monthly Expiry"}
-                )
-                .set_tags("2020-04-01", ["foo", "bar"])
-                .set_comment("2020-04-01", "This is a comment.")
-                .remove_day("2020-04-02")
-                .set_tags("2020-04-02", ["foo", "bar"])
-                .add_day(
-                    "2020-05-01",
-                    {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
-                )
-                .set_comment("2020-05-01", "This is a comment.")
-                .remove_day("2020-05-02")
-                .set_tags("2020-05-02", ["foo", "bar"]),
+                _EXPECTED_LARGE_CS,
             ),
         ],
     )
     def test_changeset_from_valid_non_empty_dict(self, d: dict, cs: ChangeSet):
-        cs0 = ChangeSet.model_validate(d)
+        cs0 = validate_changeset(d)
         assert cs0 == cs
 
-    @pytest.mark.parametrize(
-        ["d"],
-        [
-            # Invalid day type.
-            ({"add": {"2020-01-01": {"type": "foo", "name": "Holiday"}}},),
-            # Invalid date.
-            ({"add": {"foo": {"type": "holiday", "name": "Holiday"}}},),
-            ({"add": {"foo": {"type": "monthly_expiry", "name": "Holiday"}}},),
-            ({"add": {"foo": {"type": "quarterly_expiry", "name": "Holiday"}}},),
-            # # Invalid value.
-            ({"add": {"2020-01-01": {"type": "holiday", "foo": "Holiday"}}},),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "holiday",
-                            "name": "Holiday",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "holiday",
-                            "name": "Holiday",
-                            "foo": "bar",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "monthly_expiry",
-                            "foo": "Monthly Expiry",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "quarterly_expiry",
-                            "foo": "Quarterly Expiry",
-                        }
-                    }
-                },
-            ),
-            # Invalid day type.
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "foo",
-                            "name": "Special Open",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "foo",
-                            "name": "Special Close",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            # Invalid date.
-            (
-                {
-                    "add": {
-                        "foo": {
-                            "type": "special_open",
-                            "name": "Special Open",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "foo": {
-                            "type": "special_close",
-                            "name": "Special Close",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            # Invalid value key.
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "special_open",
-                            "foo": "Special Open",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "special_open",
-                            "name": "Special Open",
-                            "foo": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "special_close",
-                            "foo": "Special Close",
-                            "time": "10:00",
-                        }
-                    }
-                },
-            ),
-            (
-                {
-                    "add": {
-                        "2020-01-01": {
-                            "type": "special_close",
-                            "name": "Special Close",
-                            "foo": "10:00",
-                        }
-                    }
-                },
-            ),
-            # Invalid date.
-            ({"remove": ["2020-01-01", "foo"]},),
-        ],
-    )
+    @pytest.mark.parametrize(["d"], to_args(INVALID_DICTS), ids=case_ids(INVALID_DICTS))
     def test_changeset_from_invalid_dict(self, d: dict):
         with pytest.raises(ValidationError):
             ChangeSet.model_validate(d)
@@ -873,75 +1121,82 @@ class TestChangeSet:
     @pytest.mark.parametrize(
         ["include_meta"], [(True,), (False,)], ids=["include_meta", "exclude_meta"]
     )
-    def test_all_days(self, include_meta: bool):
-        cs = ChangeSet(
-            add={
-                "2020-01-01": {"type": "holiday", "name": "Holiday"},
-                "2020-02-01": {
-                    "type": "special_open",
-                    "name": "Special Open",
-                    "time": "10:00",
-                },
-                "2020-03-01": {
-                    "type": "special_close",
-                    "name": "Special Close",
-                    "time": "16:00",
-                },
-                "2020-04-01": {"type": "monthly_expiry", "name": "Monthly Expiry"},
-                "2020-05-01": {"type": "quarterly_expiry", "name": "Quarterly Expiry"},
-            },
-            remove=[
-                "2020-01-02",
-                "2020-02-02",
-                "2020-03-02",
-                "2020-04-02",
-                "2020-05-02",
-            ],
-            meta={
-                "2020-01-03": {"tags": ["foo", "bar"]},
-                "2020-02-03": {"tags": ["foo", "bar"]},
-                "2020-03-03": {"tags": ["foo", "bar"]},
-                "2020-04-03": {"tags": ["foo", "bar"]},
-                "2020-05-03": {"tags": ["foo", "bar"]},
-                "2020-01-04": {"comment": "This is a comment."},
-                "2020-02-04": {"comment": "This is a comment."},
-                "2020-03-04": {"comment": "This is a comment."},
-                "2020-04-04": {"comment": "This is a comment."},
-                "2020-05-04": {"comment": "This is a comment."},
-            },
+    def test_all_days(self, include_meta: bool, all_days_cs: ChangeSet):
+        # all_days only populates the private result caches, so the prototype can be shared as-is.
+        cs = all_days_cs
+        assert cs.all_days(include_meta=include_meta) == (
+            _ALL_DAYS_EXPECTED_WITH_META if include_meta else _ALL_DAYS_EXPECTED_NO_META
         )
-        assert cs.all_days(include_meta=include_meta) == tuple(
-            sorted(
-                map(
-                    TimeStampValidator.validate_python,
-                    [
-                        "2020-01-01",
-                        "2020-01-02",
-                        "2020-02-01",
-                        "2020-02-02",
-                        "2020-03-01",
-                        "2020-03-02",
-                        "2020-04-01",
-                        "2020-04-02",
-                        "2020-05-01",
-                        "2020-05-02",
-                    ]
-                    + (
-                        [
-                            "2020-01-03",
-                            "2020-02-03",
-                            "2020-03-03",
-                            "2020-04-03",
-                            "2020-05-03",
-                            "2020-01-04",
-                            "2020-02-04",
-                            "2020-03-04",
-                            "2020-04-04",
-                            "2020-05-04",
-                        ]
-                        if include_meta
-                        else []
-                    ),
-                )
-            )
+
+    @pytest.mark.parametrize(
+        ["include_meta"], [(True,), (False,)], ids=["include_meta", "exclude_meta"]
+    )
+    def test_all_days_large(self, include_meta: bool):
+        # Enough dates to reach the vectorized path in all_days, with the first meta dates overlapping the remove
+        # dates so that deduplication is exercised.
+        add_dates = tuple(f"2020-01-{day:02d}" for day in range(1, 21))
+        remove_dates = tuple(f"2020-02-{day:02d}" for day in range(1, 21))
+        meta_dates = remove_dates[:5] + tuple(
+            f"2020-03-{day:02d}" for day in range(1, 6)
+        )
+
+        cs = _make_populated_cs(
+            add={d: {"type": "holiday", "name": "Holiday"} for d in add_dates},
+            remove=list(remove_dates),
+            meta={d: {"tags": ["foo"]} for d in meta_dates},
         )
+
+        # Expected result, computed independently of the numpy round-trip.
+        dates = set(add_dates) | set(remove_dates)
+        if include_meta:
+            dates |= set(meta_dates)
+        expected = tuple(sorted(to_timestamp(d) for d in dates))
+
+        assert cs.all_days(include_meta=include_meta) == expected
+
+    def test_all_days_large_far_dates(self):
+        # Far dates may be stored by pandas in a coarser unit than nanoseconds, so the vectorized path cannot
+        # convert them to int64 nanosecond values and must fall back to the Python-level sort.
+        remove_dates = tuple(f"{year}-01-01" for year in range(1000, 1040))
+
+        cs = ChangeSet.model_validate({"remove": list(remove_dates)})
+
+        expected = tuple(sorted(to_timestamp(d) for d in remove_dates))
+
+        assert cs.all_days() == expected
+
+    def test_all_days_caching(self, empty_cs: ChangeSet):
+        cs = empty_cs
+        cs.add_day("2020-01-01", {"type": "holiday", "name": "Holiday"})
+
+        # Repeat calls serve the cached tuple, one cache slot per include_meta variant.
+        days = cs.all_days()
+        assert cs.all_days() is days
+        days_meta = cs.all_days(include_meta=True)
+        assert cs.all_days(include_meta=True) is days_meta
+
+        # Each mutator invalidates the caches.
+        cs.remove_day("2020-01-02")
+        assert cs.all_days() == (
+            to_timestamp("2020-01-01"),
+            to_timestamp("2020-01-02"),
+        )
+
+        cs.set_tags("2020-01-03", ["foo"])
+        assert cs.all_days(include_meta=True) == (
+            to_timestamp("2020-01-01"),
+            to_timestamp("2020-01-02"),
+            to_timestamp("2020-01-03"),
+        )
+
+        cs.clear_day("2020-01-02")
+        assert cs.all_days() == (to_timestamp("2020-01-01"),)
+
+        cs.add_day("2020-01-04", {"type": "holiday", "name": "Holiday"})
+        assert cs.all_days() == (
+            to_timestamp("2020-01-01"),
+            to_timestamp("2020-01-04"),
+        )
+
+        cs.clear(include_meta=True)
+        assert cs.all_days(include_meta=True) == ()